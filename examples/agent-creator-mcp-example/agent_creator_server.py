@@ -15,10 +15,103 @@ The server communicates via stdio using the Model Context Protocol.
 """
 
 import json
+import re
 import sys
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 import asyncio
 
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
+
+# Largest JSON-RPC line accepted from stdin
+_STDIN_LIMIT = 1024 * 1024
+
+# Sessions kept in memory before the least recently used one is dropped
+MAX_SESSIONS = 1024
+
+_VALID_MODELS = frozenset({
+    "gpt-4", "gpt-3.5-turbo", "claude-3-opus", "claude-3-sonnet", "claude-3-haiku"
+})
+
+# Letters, digits and underscores, with at least one letter or digit
+_NAME_RE = re.compile(r"[A-Za-z0-9_]*[A-Za-z0-9][A-Za-z0-9_]*")
+
+# Interview questions, built once and shared by every session
+_QUESTIONS: Tuple[Dict[str, Any], ...] = (
+    {
+        "step": 0,
+        "question": "What is the name of your agent?",
+        "field": "agent_name",
+        "hint": "Choose a descriptive name (e.g., 'researcher', 'writer', 'analyzer')",
+        "example": "content_researcher"
+    },
+    {
+        "step": 1,
+        "question": "What is the purpose of this agent?",
+        "field": "description",
+        "hint": "Describe what this agent does in 1-2 sentences",
+        "example": "Researches topics and gathers relevant information from various sources"
+    },
+    {
+        "step": 2,
+        "question": "Which LLM model should this agent use?",
+        "field": "model",
+        "hint": "Choose from: gpt-4, gpt-3.5-turbo, claude-3-opus, claude-3-sonnet, claude-3-haiku",
+        "example": "gpt-4"
+    },
+    {
+        "step": 3,
+        "question": "What tools should this agent have access to?",
+        "field": "tools",
+        "hint": "Comma-separated list. Available: web_search, calculator, text_length, json_validator, string_formatter",
+        "example": "web_search, summarizer"
+    },
+    {
+        "step": 4,
+        "question": "What temperature should the model use? (0.0-1.0)",
+        "field": "temperature",
+        "hint": "Lower = more deterministic, Higher = more creative. Default is 0.7",
+        "example": "0.7"
+    },
+    {
+        "step": 5,
+        "question": "Maximum tokens for responses?",
+        "field": "max_tokens",
+        "hint": "Maximum length of generated responses. Default is 1000",
+        "example": "1000"
+    },
+    {
+        "step": 6,
+        "question": "Does this agent depend on another agent's output? (optional)",
+        "field": "inputs",
+        "hint": "Name of another agent this one depends on, or leave empty",
+        "example": "researcher (or leave empty)"
+    },
+    {
+        "step": 7,
+        "question": "What should the output be named?",
+        "field": "outputs",
+        "hint": "Name for this agent's output that other agents can reference",
+        "example": "research_summary"
+    }
+)
+
+
+def _write_line(data: bytes) -> None:
+    """Write one encoded JSON-RPC message to stdout, bypassing text-mode encoding"""
+    sys.stdout.buffer.write(data + b"\n")
+    sys.stdout.buffer.flush()
+
 
 class AgentCreatorSession:
     """Manages the state of an agent creation session"""
@@ -36,82 +129,21 @@ class AgentCreatorSession:
 
     def get_next_question(self) -> Optional[Dict[str, Any]]:
         """Get the next question to ask the user"""
-        questions = [
-            {
-                "step": 0,
-                "question": "What is the name of your agent?",
-                "field": "agent_name",
-                "hint": "Choose a descriptive name (e.g., 'researcher', 'writer', 'analyzer')",
-                "example": "content_researcher"
-            },
-            {
-                "step": 1,
-                "question": "What is the purpose of this agent?",
-                "field": "description",
-                "hint": "Describe what this agent does in 1-2 sentences",
-                "example": "Researches topics and gathers relevant information from various sources"
-            },
-            {
-                "step": 2,
-                "question": "Which LLM model should this agent use?",
-                "field": "model",
-                "hint": "Choose from: gpt-4, gpt-3.5-turbo, claude-3-opus, claude-3-sonnet, claude-3-haiku",
-                "example": "gpt-4"
-            },
-            {
-                "step": 3,
-                "question": "What tools should this agent have access to?",
-                "field": "tools",
-                "hint": "Comma-separated list. Available: web_search, calculator, text_length, json_validator, string_formatter",
-                "example": "web_search, summarizer"
-            },
-            {
-                "step": 4,
-                "question": "What temperature should the model use? (0.0-1.0)",
-                "field": "temperature",
-                "hint": "Lower = more deterministic, Higher = more creative. Default is 0.7",
-                "example": "0.7"
-            },
-            {
-                "step": 5,
-                "question": "Maximum tokens for responses?",
-                "field": "max_tokens",
-                "hint": "Maximum length of generated responses. Default is 1000",
-                "example": "1000"
-            },
-            {
-                "step": 6,
-                "question": "Does this agent depend on another agent's output? (optional)",
-                "field": "inputs",
-                "hint": "Name of another agent this one depends on, or leave empty",
-                "example": "researcher (or leave empty)"
-            },
-            {
-                "step": 7,
-                "question": "What should the output be named?",
-                "field": "outputs",
-                "hint": "Name for this agent's output that other agents can reference",
-                "example": "research_summary"
-            }
-        ]
-
-        if self.current_step < len(questions):
-            return questions[self.current_step]
+        if self.current_step < len(_QUESTIONS):
+            return _QUESTIONS[self.current_step]
         return None
 
     def set_answer(self, field: str, value: str) -> bool:
         """Set the answer for a field and validate it"""
         try:
             if field == "agent_name":
-                if not value or not value.replace("_", "").isalnum():
+                if not value or not _NAME_RE.fullmatch(value):
                     return False
                 self.agent_name = value
             elif field == "description":
                 self.description = value
             elif field == "model":
-                valid_models = ["gpt-4", "gpt-3.5-turbo", "claude-3-opus",
-                               "claude-3-sonnet", "claude-3-haiku"]
-                if value not in valid_models:
+                if value not in _VALID_MODELS:
                     return False
                 self.model = value
             elif field == "tools":
@@ -149,72 +181,56 @@ class AgentCreatorSession:
 
     def generate_yaml(self) -> str:
         """Generate the Weave YAML configuration"""
-        config = {
-            "version": "1.0",
-            "agents": {
-                self.agent_name: {
-                    "model": self.model
-                }
-            }
-        }
-
-        agent_config = config["agents"][self.agent_name]
-
-        if self.tools:
-            agent_config["tools"] = self.tools
-
-        if self.inputs:
-            agent_config["inputs"] = self.inputs
-
-        if self.outputs:
-            agent_config["outputs"] = self.outputs
+        description = f"    # {self.description}\n" if self.description else ""
+        tools = f"    tools: [{', '.join(self.tools)}]\n" if self.tools else ""
+        inputs = f"    inputs: \"{self.inputs}\"\n" if self.inputs else ""
+        outputs = f"    outputs: \"{self.outputs}\"\n" if self.outputs else ""
 
+        config = ""
         if self.temperature != 0.7 or self.max_tokens != 1000:
-            agent_config["config"] = {}
+            config = "    config:\n"
             if self.temperature != 0.7:
-                agent_config["config"]["temperature"] = self.temperature
+                config += f"      temperature: {self.temperature}\n"
             if self.max_tokens != 1000:
-                agent_config["config"]["max_tokens"] = self.max_tokens
-
-        # Convert to YAML-like format
-        yaml_lines = ["version: \"1.0\"", "", "agents:"]
-        yaml_lines.append(f"  {self.agent_name}:")
-
-        if self.description:
-            yaml_lines.append(f"    # {self.description}")
-
-        yaml_lines.append(f"    model: \"{self.model}\"")
-
-        if self.tools:
-            tools_str = "[" + ", ".join(self.tools) + "]"
-            yaml_lines.append(f"    tools: {tools_str}")
+                config += f"      max_tokens: {self.max_tokens}\n"
 
-        if self.inputs:
-            yaml_lines.append(f"    inputs: \"{self.inputs}\"")
-
-        if self.outputs:
-            yaml_lines.append(f"    outputs: \"{self.outputs}\"")
-
-        if self.temperature != 0.7 or self.max_tokens != 1000:
-            yaml_lines.append("    config:")
-            if self.temperature != 0.7:
-                yaml_lines.append(f"      temperature: {self.temperature}")
-            if self.max_tokens != 1000:
-                yaml_lines.append(f"      max_tokens: {self.max_tokens}")
-
-        return "\n".join(yaml_lines)
+        yaml_text = (
+            f"version: \"1.0\"\n\nagents:\n  {self.agent_name}:\n"
+            f"{description}    model: \"{self.model}\"\n{tools}{inputs}{outputs}{config}"
+        )
+        # Every segment ends with a newline; the document itself does not
+        return yaml_text[:-1]
 
 
 class AgentCreatorMCPServer:
     """MCP Server for creating Weave agent configurations"""
 
     def __init__(self):
-        self.sessions: Dict[str, AgentCreatorSession] = {}
+        # Least recently used first; the oldest session is dropped past MAX_SESSIONS
+        self.sessions: "OrderedDict[str, AgentCreatorSession]" = OrderedDict()
+        # The tool schema never changes, so tools/list is answered from this dict
+        self._tools_list_response: Dict[str, Any] = {
+            "tools": self.list_available_tools()
+        }
+        # ...and encoded once, without its closing brace, so only the id is added per call
+        self._tools_list_json: bytes = _dumps(self._tools_list_response)[:-1]
+        # Copies stdin into the reader when the event loop cannot watch it
+        self._stdin_task: Optional["asyncio.Task[None]"] = None
+
+    def _get_session(self, session_id: str) -> Optional[AgentCreatorSession]:
+        """Look up a session and mark it as most recently used"""
+        session = self.sessions.get(session_id)
+        if session is not None:
+            self.sessions.move_to_end(session_id)
+        return session
 
     def start_session(self, session_id: str) -> Dict[str, Any]:
         """Start a new agent creation session"""
         session = AgentCreatorSession()
         self.sessions[session_id] = session
+        self.sessions.move_to_end(session_id)
+        while len(self.sessions) > MAX_SESSIONS:
+            self.sessions.popitem(last=False)
 
         first_question = session.get_next_question()
 
@@ -227,13 +243,13 @@ class AgentCreatorMCPServer:
 
     def answer_question(self, session_id: str, answer: str) -> Dict[str, Any]:
         """Process an answer and return the next question or final config"""
-        if session_id not in self.sessions:
+        session = self._get_session(session_id)
+        if session is None:
             return {
                 "status": "error",
                 "message": f"Session {session_id} not found. Please start a new session."
             }
 
-        session = self.sessions[session_id]
         current_question = session.get_next_question()
 
         if not current_question:
@@ -272,13 +288,13 @@ class AgentCreatorMCPServer:
 
     def get_session_status(self, session_id: str) -> Dict[str, Any]:
         """Get the current status of a session"""
-        if session_id not in self.sessions:
+        session = self._get_session(session_id)
+        if session is None:
             return {
                 "status": "error",
                 "message": f"Session {session_id} not found."
             }
 
-        session = self.sessions[session_id]
         return {
             "status": "active",
             "session_id": session_id,
@@ -344,9 +360,7 @@ class AgentCreatorMCPServer:
         params = request.get("params", {})
 
         if method == "tools/list":
-            return {
-                "tools": self.list_available_tools()
-            }
+            return self._tools_list_response
 
         elif method == "tools/call":
             tool_name = params.get("name")
@@ -373,7 +387,7 @@ class AgentCreatorMCPServer:
                 "content": [
                     {
                         "type": "text",
-                        "text": json.dumps(result, indent=2)
+                        "text": _dumps(result).decode()
                     }
                 ]
             }
@@ -397,27 +411,104 @@ class AgentCreatorMCPServer:
             }
         }
 
+    async def _open_stdin(self) -> asyncio.StreamReader:
+        """Wrap stdin in an asyncio stream reader owned by the running loop"""
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=_STDIN_LIMIT)
+        try:
+            await loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+            )
+        except ValueError:
+            # stdin redirected from a regular file: it never blocks, so read it whole
+            reader.feed_data(sys.stdin.buffer.read())
+            reader.feed_eof()
+        except (NotImplementedError, OSError):
+            # The loop cannot watch stdin (e.g. the Windows proactor loop with
+            # a console): read it line by line on a worker thread instead
+            self._stdin_task = loop.create_task(self._pump_stdin(reader))
+        return reader
+
+    async def _pump_stdin(self, reader: asyncio.StreamReader) -> None:
+        """Copy stdin into reader using blocking reads on the default executor"""
+        loop = asyncio.get_running_loop()
+        while True:
+            # At most one byte past the limit, so an overlong line is still
+            # detected by _read_line without being read whole
+            data = await loop.run_in_executor(
+                None, sys.stdin.buffer.readline, _STDIN_LIMIT + 1
+            )
+            if not data:
+                reader.feed_eof()
+                return
+            reader.feed_data(data)
+
+    async def _read_line(self, reader: asyncio.StreamReader) -> Optional[bytes]:
+        """Read one line from stdin, or None if it is longer than _STDIN_LIMIT
+
+        An overlong line is discarded up to and including its newline, so
+        reading resumes at the next request.
+        """
+        try:
+            return await reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            # EOF: the last line had no newline (b"" when nothing is left)
+            return e.partial
+        except asyncio.LimitOverrunError as e:
+            consumed = e.consumed
+
+        while True:
+            await reader.readexactly(consumed)
+            try:
+                await reader.readuntil(b"\n")
+                return None
+            except asyncio.IncompleteReadError:
+                return None
+            except asyncio.LimitOverrunError as e:
+                consumed = e.consumed
+
+    def _encode_response(self, request: Dict[str, Any], response: Dict[str, Any]) -> bytes:
+        """Serialize a handler result as a JSON-RPC response to request"""
+        envelope: Dict[str, Any] = {}
+
+        # Add request ID to response
+        if "id" in request:
+            envelope["id"] = request["id"]
+
+        envelope["jsonrpc"] = "2.0"
+
+        if response is self._tools_list_response:
+            # Splice the envelope onto the pre-encoded tool schema
+            return self._tools_list_json + b"," + _dumps(envelope)[1:]
+
+        return _dumps({**response, **envelope})
+
     async def run(self):
         """Run the MCP server on stdio"""
+        reader = await self._open_stdin()
+
         while True:
+            request = None
             try:
-                line = await asyncio.get_event_loop().run_in_executor(
-                    None, sys.stdin.readline
-                )
+                line = await self._read_line(reader)
+
+                if line is None:
+                    # The request id is unknown, so the error carries none
+                    _write_line(_dumps({
+                        "jsonrpc": "2.0",
+                        "error": {
+                            "code": -32700,
+                            "message": f"Parse error: request exceeds {_STDIN_LIMIT} bytes"
+                        }
+                    }))
+                    continue
 
                 if not line:
                     break
 
-                request = json.loads(line)
+                request = _loads(line)
                 response = await self.handle_request(request)
-
-                # Add request ID to response
-                if "id" in request:
-                    response["id"] = request["id"]
-
-                response["jsonrpc"] = "2.0"
-
-                print(json.dumps(response), flush=True)
+                _write_line(self._encode_response(request, response))
 
             except json.JSONDecodeError:
                 continue
@@ -429,9 +520,9 @@ class AgentCreatorMCPServer:
                         "message": f"Internal error: {str(e)}"
                     }
                 }
-                if "id" in request:
+                if isinstance(request, dict) and "id" in request:
                     error_response["id"] = request["id"]
-                print(json.dumps(error_response), flush=True)
+                _write_line(_dumps(error_response))
 
 
 async def main():
@@ -440,5 +531,15 @@ async def main():
     await server.run()
 
 
+def _install_fast_loop() -> None:
+    """Use uvloop's event loop policy when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
+
 if __name__ == "__main__":
+    _install_fast_loop()
     asyncio.run(main())
@@ -0,0 +1,8 @@
+"""Compatibility shims for the supported Python versions."""
+
+import sys
+from typing import Dict
+
+# Keyword arguments for dataclass() that add __slots__ where supported:
+# dataclass(slots=True) needs Python 3.10; on 3.9 instances keep a __dict__
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
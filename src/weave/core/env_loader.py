@@ -1,8 +1,21 @@
 """Simple .env file loader for Weave."""
 
 import os
+import re
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+# One KEY=VALUE assignment per line. Lines starting with # and lines without
+# "=" never match. A value wrapped in matching quotes is captured without them.
+_ENV_LINE_RE = re.compile(
+    r"""^[^\S\n]*([^#=\s][^=\n]*?)[^\S\n]*=[^\S\n]*"""
+    r"""(?:"(.*)"|'(.*)'|(.*?))[^\S\n]*$""",
+    re.MULTILINE,
+)
+
+# Parsed assignments per resolved path, with the file's mtime (ns) when it was
+# read; a file whose mtime changed is parsed again
+_ENV_CACHE: Dict[str, Tuple[int, Tuple[Tuple[str, str], ...]]] = {}
 
 
 def load_env_file(env_path: Optional[Path] = None) -> None:
@@ -47,28 +60,39 @@ def _parse_env_file(path: Path) -> None:
     Args:
         path: Path to .env file
     """
-    with open(path, 'r') as f:
-        for line in f:
-            line = line.strip()
-
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
-
-            # Parse KEY=VALUE
-            if '=' not in line:
-                continue
-
-            key, value = line.split('=', 1)
-            key = key.strip()
-            value = value.strip()
-
-            # Remove quotes if present
-            if value.startswith('"') and value.endswith('"'):
-                value = value[1:-1]
-            elif value.startswith("'") and value.endswith("'"):
-                value = value[1:-1]
-
-            # Set environment variable (don't override existing ones)
-            if key and not os.getenv(key):
-                os.environ[key] = value
+    cache_key = str(path.resolve())
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _ENV_CACHE.get(cache_key)
+    if cached and cached[0] == mtime_ns:
+        assignments = cached[1]
+    else:
+        assignments = _read_assignments(path)
+        _ENV_CACHE[cache_key] = (mtime_ns, assignments)
+
+    for key, value in assignments:
+        # Set environment variable (don't override existing ones)
+        if not os.environ.get(key):
+            os.environ[key] = value
+
+
+def _read_assignments(path: Path) -> Tuple[Tuple[str, str], ...]:
+    """
+    Read the KEY=VALUE assignments of a .env file, in file order.
+
+    Args:
+        path: Path to .env file
+
+    Returns:
+        Tuple of (key, value) pairs with surrounding quotes removed
+    """
+    assignments = []
+    for match in _ENV_LINE_RE.finditer(path.read_text()):
+        key, double_quoted, single_quoted, bare = match.groups()
+        if double_quoted is not None:
+            value = double_quoted
+        elif single_quoted is not None:
+            value = single_quoted
+        else:
+            value = bare
+        assignments.append((key, value))
+    return tuple(assignments)
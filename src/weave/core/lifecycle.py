@@ -0,0 +1,30 @@
+"""Process lifecycle helpers shared by long-lived resources."""
+
+import atexit
+import functools
+import weakref
+from typing import Callable
+
+
+def _call_if_alive(method_ref: "weakref.WeakMethod") -> None:
+    """Call a weakly referenced bound method, unless its owner was collected."""
+    method = method_ref()
+    if method is not None:
+        method()
+
+
+def close_at_exit(close: Callable[[], None]) -> Callable[[], None]:
+    """Register a bound close() method to run at interpreter exit.
+
+    Only a weak reference to the owner is kept, so registering does not keep
+    the object alive until exit.
+
+    Args:
+        close: Bound method to call at exit
+
+    Returns:
+        The registered callback, to pass to atexit.unregister once closed
+    """
+    callback = functools.partial(_call_if_alive, weakref.WeakMethod(close))
+    atexit.register(callback)
+    return callback
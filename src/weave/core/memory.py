@@ -6,14 +6,27 @@ This module provides:
 - Auto-compact: Automatic summarization when context exceeds token limits
 """
 
+import atexit
+import functools
+import io
 import os
+import stat
 import time
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Callable, Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 
+from weave.core.compat import DATACLASS_SLOTS
+from weave.core.lifecycle import close_at_exit
 from weave.core.sessions import ConversationMessage, ConversationSession
 
+# Bound once for Memory.to_markdown, which runs for every saved memory
+_localtime = time.localtime
+_strftime = time.strftime
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 
 def estimate_tokens(text: str) -> int:
     """Estimate token count from text.
@@ -44,7 +57,7 @@ def count_message_tokens(messages: List[ConversationMessage]) -> int:
     return sum(estimate_tokens(msg.content) for msg in messages)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Memory:
     """A single memory entry for long-term storage."""
 
@@ -56,21 +69,20 @@ class Memory:
 
     def to_markdown(self) -> str:
         """Convert memory to markdown format."""
-        lines = [
-            f"**{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.timestamp))}** (Importance: {self.importance})",
-            "",
-            self.content,
-        ]
+        timestamp = _strftime(_TIMESTAMP_FORMAT, _localtime(self.timestamp))
+        markdown = f"**{timestamp}** (Importance: {self.importance})\n\n{self.content}"
 
-        if self.tags:
-            lines.extend(["", f"*Tags: {', '.join(self.tags)}*"])
+        # Most memories carry neither tags nor metadata
+        if not self.tags and not self.metadata:
+            return markdown
 
+        tags = f"\n\n*Tags: {', '.join(self.tags)}*" if self.tags else ""
+        metadata = ""
         if self.metadata:
-            lines.extend(["", "---", "Metadata:"])
-            for key, value in self.metadata.items():
-                lines.append(f"- {key}: {value}")
+            items = "\n".join(f"- {key}: {value}" for key, value in self.metadata.items())
+            metadata = f"\n\n---\nMetadata:\n{items}"
 
-        return "\n".join(lines)
+        return f"{markdown}{tags}{metadata}"
 
 
 class ShortTermMemory:
@@ -98,13 +110,18 @@ class ShortTermMemory:
         self.summary_message: Optional[ConversationMessage] = None
 
     def apply_strategy(
-        self, messages: List[ConversationMessage], auto_compact: bool = True
+        self,
+        messages: List[ConversationMessage],
+        auto_compact: bool = True,
+        system_messages: Optional[List[ConversationMessage]] = None,
     ) -> List[ConversationMessage]:
         """Apply memory strategy to message list.
 
         Args:
             messages: Full message list
             auto_compact: Whether to apply auto-compaction based on token limits
+            system_messages: System messages of `messages`, if already known;
+                avoids scanning the full list
 
         Returns:
             Filtered message list according to strategy
@@ -112,15 +129,16 @@ class ShortTermMemory:
         # Check if auto-compact is needed
         if auto_compact and self._should_compact(messages):
             messages = self._compact_messages(messages)
+            system_messages = None
 
         # Apply selected strategy
         if self.strategy == "buffer" or self.strategy == "auto_compact":
-            return self._apply_buffer(messages)
+            return self._apply_buffer(messages, system_messages)
         elif self.strategy == "sliding_window":
             return self._apply_sliding_window(messages)
         else:
             # Default to buffer
-            return self._apply_buffer(messages)
+            return self._apply_buffer(messages, system_messages)
 
     def _should_compact(self, messages: List[ConversationMessage]) -> bool:
         """Check if messages should be compacted.
@@ -135,15 +153,17 @@ class ShortTermMemory:
         if self.summary_message or len(messages) < 5:
             return False
 
-        # Check token count
-        token_count = count_message_tokens(messages)
-        if token_count > self.context_window:
-            return True
-
         # Check message count if summarize_after is set
         if self.summarize_after and len(messages) > self.summarize_after:
             return True
 
+        # Check token count, stopping as soon as the limit is exceeded
+        token_count = 0
+        for msg in messages:
+            token_count += estimate_tokens(msg.content)
+            if token_count > self.context_window:
+                return True
+
         return False
 
     def _compact_messages(
@@ -166,8 +186,13 @@ class ShortTermMemory:
             return messages
 
         # Separate system messages and conversation messages
-        system_messages = [msg for msg in messages if msg.role == "system"]
-        conversation_messages = [msg for msg in messages if msg.role != "system"]
+        system_messages = []
+        conversation_messages = []
+        for msg in messages:
+            if msg.role == "system":
+                system_messages.append(msg)
+            else:
+                conversation_messages.append(msg)
 
         # Keep last 10 conversation messages
         recent_messages = conversation_messages[-10:]
@@ -198,11 +223,16 @@ class ShortTermMemory:
         # Return: system messages + summary + recent messages
         return system_messages + [self.summary_message] + recent_messages
 
-    def _apply_buffer(self, messages: List[ConversationMessage]) -> List[ConversationMessage]:
+    def _apply_buffer(
+        self,
+        messages: List[ConversationMessage],
+        system_messages: Optional[List[ConversationMessage]] = None,
+    ) -> List[ConversationMessage]:
         """Buffer strategy: Keep system message + last N messages.
 
         Args:
             messages: Full message list
+            system_messages: System messages of `messages`, if already known
 
         Returns:
             System message + last N messages
@@ -210,14 +240,33 @@ class ShortTermMemory:
         if len(messages) <= self.max_messages:
             return messages
 
-        # Keep system messages
-        system_messages = [msg for msg in messages if msg.role == "system"]
-
-        # Get recent messages
-        other_messages = [msg for msg in messages if msg.role != "system"]
-        recent_messages = other_messages[-(self.max_messages - len(system_messages)) :]
+        if system_messages is not None:
+            # Only the tail is visited, so the cost does not grow with the
+            # length of the conversation
+            keep = max(self.max_messages - len(system_messages), 0)
+            tail: List[ConversationMessage] = []
+            for msg in reversed(messages):
+                if len(tail) >= keep:
+                    break
+                if msg.role != "system":
+                    tail.append(msg)
+            tail.reverse()
+            return system_messages + tail
+
+        # Single pass: keep every system message, and only the newest
+        # non-system messages that could still fit
+        system_messages = []
+        recent_messages: Deque[ConversationMessage] = deque(maxlen=self.max_messages)
+        for msg in messages:
+            if msg.role == "system":
+                system_messages.append(msg)
+            else:
+                recent_messages.append(msg)
 
-        return system_messages + recent_messages
+        keep = max(self.max_messages - len(system_messages), 0)
+        return system_messages + list(
+            islice(recent_messages, len(recent_messages) - keep, None)
+        )
 
     def _apply_sliding_window(self, messages: List[ConversationMessage]) -> List[ConversationMessage]:
         """Sliding window strategy: Keep last N messages only.
@@ -235,7 +284,11 @@ class ShortTermMemory:
 
 
 class LongTermMemory:
-    """Manages long-term memory using simple markdown files."""
+    """Manages long-term memory using simple markdown files.
+
+    Memory files are kept open for appending, so saving a memory does not
+    reopen the file. They are closed by close() or at interpreter exit.
+    """
 
     def __init__(self, memory_dir: Optional[Path] = None):
         """Initialize long-term memory.
@@ -249,6 +302,55 @@ class LongTermMemory:
         # Secure the memory directory
         os.chmod(self.memory_dir, 0o700)
 
+        # agent_name -> ((mtime_ns, size), content) of the last file read
+        self._cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+        # agent_name -> memory file open for buffered appends
+        self._handles: Dict[str, BinaryIO] = {}
+
+        # Close open memory files at exit without keeping this object alive;
+        # registered while any file is open
+        self._atexit: Optional[Callable[[], None]] = None
+
+    def __enter__(self) -> "LongTermMemory":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all open memory files.
+
+        Saving again afterwards reopens the agent's memory file.
+        """
+        if self._atexit is not None:
+            atexit.unregister(self._atexit)
+            self._atexit = None
+        while self._handles:
+            _, handle = self._handles.popitem()
+            handle.close()
+
+    def _get_handle(self, agent_name: str) -> BinaryIO:
+        """Get the agent's memory file open for appending, opening it if needed."""
+        handle = self._handles.get(agent_name)
+        if handle is None:
+            memory_file = self.memory_dir / f"{agent_name}_memory.md"
+
+            # Append to existing file or create new (owner-only) in a single open
+            fd = os.open(memory_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+
+            # New files are created 0o600; only older files may need securing
+            if stat.S_IMODE(os.fstat(fd).st_mode) != 0o600:
+                os.chmod(memory_file, 0o600)
+
+            handle = self._handles[agent_name] = os.fdopen(
+                fd, "ab", buffering=io.DEFAULT_BUFFER_SIZE
+            )
+
+            if self._atexit is None:
+                self._atexit = close_at_exit(self.close)
+        return handle
+
     def save_memory(self, agent_name: str, memory: Memory) -> None:
         """Save a memory to the agent's memory file.
 
@@ -256,21 +358,18 @@ class LongTermMemory:
             agent_name: Name of the agent
             memory: Memory to save
         """
-        memory_file = self.memory_dir / f"{agent_name}_memory.md"
-
-        # Append to existing file or create new
-        mode = "a" if memory_file.exists() else "w"
+        handle = self._get_handle(agent_name)
 
-        with open(memory_file, mode) as f:
-            if mode == "a":
-                f.write("\n\n---\n\n")
-            else:
-                f.write(f"# Long-Term Memory: {agent_name}\n\n")
+        # In append mode the position is the file size
+        if handle.tell():
+            separator = "\n\n---\n\n"
+        else:
+            separator = f"# Long-Term Memory: {agent_name}\n\n"
 
-            f.write(memory.to_markdown())
+        handle.write((separator + memory.to_markdown()).encode("utf-8"))
+        handle.flush()
 
-        # Secure the memory file
-        os.chmod(memory_file, 0o600)
+        self._cache.pop(agent_name, None)
 
     def load_memories(self, agent_name: str) -> Optional[str]:
         """Load all memories for an agent.
@@ -283,15 +382,27 @@ class LongTermMemory:
         """
         memory_file = self.memory_dir / f"{agent_name}_memory.md"
 
-        if not memory_file.exists():
+        try:
+            st = memory_file.stat()
+        except OSError:
+            self._cache.pop(agent_name, None)
             return None
 
+        # Reuse the last read while the file is unchanged
+        version = (st.st_mtime_ns, st.st_size)
+        cached = self._cache.get(agent_name)
+        if cached and cached[0] == version:
+            return cached[1]
+
         try:
-            with open(memory_file) as f:
-                return f.read()
+            with open(memory_file, encoding="utf-8") as f:
+                content = f.read()
         except Exception:
             return None
 
+        self._cache[agent_name] = (version, content)
+        return content
+
     def clear_memories(self, agent_name: str) -> bool:
         """Clear all memories for an agent.
 
@@ -302,6 +413,11 @@ class LongTermMemory:
             True if cleared, False if no memories existed
         """
         memory_file = self.memory_dir / f"{agent_name}_memory.md"
+        self._cache.pop(agent_name, None)
+
+        handle = self._handles.pop(agent_name, None)
+        if handle is not None:
+            handle.close()
 
         if memory_file.exists():
             memory_file.unlink()
@@ -315,13 +431,16 @@ class LongTermMemory:
         Returns:
             List of agent names
         """
+        suffix = "_memory.md"
         agents = []
 
-        for memory_file in self.memory_dir.glob("*_memory.md"):
-            agent_name = memory_file.stem.replace("_memory", "")
-            agents.append(agent_name)
+        with os.scandir(self.memory_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix):
+                    agents.append(entry.name[: -len(suffix)])
 
-        return sorted(agents)
+        agents.sort()
+        return agents
 
 
 class MemoryManager:
@@ -408,13 +527,7 @@ class MemoryManager:
         return self.long_term.clear_memories(self.agent_name)
 
 
-# Global instances
-_long_term_memory = None
-
-
+@functools.cache
 def get_long_term_memory() -> LongTermMemory:
     """Get global long-term memory instance."""
-    global _long_term_memory
-    if _long_term_memory is None:
-        _long_term_memory = LongTermMemory()
-    return _long_term_memory
+    return LongTermMemory()
@@ -8,7 +8,7 @@ from weave.tools.models import (
     ToolDefinition,
 )
 from weave.tools.executor import ToolExecutor
-from weave.tools.mcp_client import MCPClient, MCPServer
+from weave.tools.mcp_client import AsyncMCPClient, MCPClient, MCPServer
 
 __all__ = [
     "Tool",
@@ -18,5 +18,6 @@ __all__ = [
     "ToolDefinition",
     "ToolExecutor",
     "MCPClient",
+    "AsyncMCPClient",
     "MCPServer",
 ]
@@ -2,15 +2,62 @@
 
 import os
 import json
+import time
+import atexit
+import logging
+import asyncio
+import itertools
 import subprocess
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 
+from weave.core.compat import DATACLASS_SLOTS
+from weave.core.lifecycle import close_at_exit
 from weave.tools.models import ToolDefinition, ToolParameter, ParameterType
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Optional fast JSON codec for the JSON-RPC hot path
+_dumps: Callable[[Any], bytes]
+_loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _dumps = _json_dumps
+    _loads = json.loads
+
+# Buffer size for the stdio pipes of MCP server processes. Tool lists can be
+# large, so this is well above io.DEFAULT_BUFFER_SIZE to keep syscalls down.
+_PIPE_BUFFER_SIZE = 64 * 1024
+
+# Longest JSON-RPC line AsyncMCPClient accepts from a server
+_MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+# Seconds a server gets to exit after SIGTERM before it is killed
+_STOP_TIMEOUT = 5.0
+
+# JSON schema type -> ParameterType; unknown types are treated as strings
+_JSON_TYPE_MAP: Dict[str, ParameterType] = {
+    "string": ParameterType.STRING,
+    "number": ParameterType.NUMBER,
+    "integer": ParameterType.NUMBER,
+    "boolean": ParameterType.BOOLEAN,
+    "array": ParameterType.ARRAY,
+    "object": ParameterType.OBJECT,
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class MCPServer:
     """MCP server configuration."""
     name: str
@@ -20,67 +67,440 @@ class MCPServer:
     enabled: bool = True
     description: str = ""
 
+    @classmethod
+    def from_dict(cls, name: str, config: Any) -> "MCPServer":
+        """Build a server definition from a config entry.
 
-class MCPClient:
-    """Client for interacting with MCP servers via stdio."""
+        Args:
+            name: Server name
+            config: Entry from the config file, or an MCPServerConfig from
+                the weave config
+
+        Returns:
+            Server definition with defaults filled in
+
+        Raises:
+            ValueError: If the entry is not a mapping or has no command
+        """
+        if hasattr(config, "model_dump"):
+            config = config.model_dump()
+
+        if not isinstance(config, dict):
+            raise ValueError(f"MCP server '{name}' must be a mapping, got {type(config).__name__}")
+
+        command = config.get("command")
+        if not command:
+            raise ValueError(f"MCP server '{name}' has no command")
+
+        # Copy the containers; config entries may be shared between clients
+        return cls(
+            name=name,
+            command=command,
+            args=list(config.get("args") or []),
+            env=dict(config.get("env") or {}),
+            enabled=config.get("enabled", True),
+            description=config.get("description", ""),
+        )
+
+
+class _MCPClientBase:
+    """Server configuration and JSON-RPC message handling shared by MCP clients."""
+
+    # Parsed config files shared by all clients: path -> ((mtime_ns, size), config)
+    _config_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
 
     def __init__(self, weave_config: Optional[Any] = None):
-        """Initialize MCP client.
+        """Load MCP server definitions.
 
         Args:
             weave_config: Weave configuration containing MCP server definitions
         """
         self.servers: Dict[str, MCPServer] = {}
-        self.processes: Dict[str, subprocess.Popen] = {}
+        # Parsed tools/list results per running server
+        self._tools_cache: Dict[str, List[ToolDefinition]] = {}
+        # Process environments per server, built on first start
+        self._envs: Dict[str, Dict[str, str]] = {}
+        # JSON-RPC request ids, unique across all servers of this client
+        self._request_ids = itertools.count(1)
+        self._weave_config = weave_config
         self.config_path = Path.home() / ".weave" / "mcp_config.yaml"
 
-        # Load MCP servers from weave config
+        self._load_servers()
+
+    def reload_config(self) -> None:
+        """Reload server definitions and rebuild server environments.
+
+        Call this after changing the config file or os.environ. Servers that
+        are already running keep their process until they are restarted.
+        """
+        self._envs.clear()
+        self._load_servers()
+
+    def _load_servers(self) -> None:
+        """Load server definitions from the config file and the weave config."""
+        weave_config = self._weave_config
+        servers: Dict[str, MCPServer] = {}
+
+        # Servers from the weave config come first and take precedence; an
+        # invalid entry there is an error in the weave being run
         if weave_config and hasattr(weave_config, "mcp_servers"):
             for name, server_config in weave_config.mcp_servers.items():
-                self.servers[name] = MCPServer(
-                    name=name,
-                    command=server_config.get("command", ""),
-                    args=server_config.get("args", []),
-                    env=server_config.get("env", {}),
-                    enabled=server_config.get("enabled", True),
-                    description=server_config.get("description", ""),
-                )
+                servers[name] = MCPServer.from_dict(name, server_config)
 
-        # Also load from config file if exists
-        if self.config_path.exists():
-            self._load_from_config()
+        # The user-wide config file is shared by every weave, so a bad entry
+        # in it is skipped rather than breaking every client
+        for name, server_config in self._load_from_config().items():
+            if name in servers:
+                continue
+            try:
+                servers[name] = MCPServer.from_dict(name, server_config)
+            except ValueError as e:
+                logger.warning("Skipping MCP server from %s: %s", self.config_path, e)
+
+        self.servers = servers
+
+    def _load_from_config(self) -> Dict[str, Any]:
+        """Load MCP server entries from config file.
 
-    def _load_from_config(self):
-        """Load MCP servers from config file."""
+        Returns:
+            Server name to config entry; empty if the file does not exist
+            or is invalid
+        """
         try:
-            import yaml
-            with open(self.config_path) as f:
-                config = yaml.safe_load(f)
-
-            if config and "mcp_servers" in config:
-                for name, server_config in config["mcp_servers"].items():
-                    if name not in self.servers:
-                        self.servers[name] = MCPServer(
-                            name=name,
-                            command=server_config.get("command", ""),
-                            args=server_config.get("args", []),
-                            env=server_config.get("env", {}),
-                            enabled=server_config.get("enabled", True),
-                            description=server_config.get("description", ""),
-                        )
+            path = str(self.config_path)
+            st = os.stat(path)
+            key = (st.st_mtime_ns, st.st_size)
+            cached = self._config_cache.get(path)
+            if cached is not None and cached[0] == key:
+                config = cached[1]
+            else:
+                import yaml
+                # libyaml's C loader is much faster when PyYAML was built with it
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                with open(path) as f:
+                    config = yaml.load(f, Loader=loader)
+                self._config_cache[path] = (key, config)
+
+            return dict(config["mcp_servers"])
         except Exception:
             # Silently fail if config doesn't exist or is invalid
-            pass
+            return {}
 
     def list_servers(self) -> List[MCPServer]:
         """List all configured MCP servers."""
         return list(self.servers.values())
 
-    def start_server(self, server_name: str) -> bool:
+    def _server_env(self, server: MCPServer) -> Optional[Dict[str, str]]:
+        """Get the environment for a server process.
+
+        Returns:
+            None to inherit os.environ unchanged, or os.environ merged with
+            the server's variables (computed once per server; see
+            reload_config)
+        """
+        if not server.env:
+            return None
+
+        env = self._envs.get(server.name)
+        if env is None:
+            env = self._envs[server.name] = {**os.environ, **server.env}
+        return env
+
+    def _initialize_request(self) -> Dict[str, Any]:
+        """Build an initialize JSON-RPC request."""
+        return {
+            "jsonrpc": "2.0",
+            "id": next(self._request_ids),
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "clientInfo": {
+                    "name": "weave",
+                    "version": "0.1.0"
+                }
+            }
+        }
+
+    def _tools_list_request(self) -> Dict[str, Any]:
+        """Build a tools/list JSON-RPC request."""
+        return {
+            "jsonrpc": "2.0",
+            "id": next(self._request_ids),
+            "method": "tools/list",
+            "params": {}
+        }
+
+    def _call_request(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a tools/call JSON-RPC request."""
+        return {
+            "jsonrpc": "2.0",
+            "id": next(self._request_ids),
+            "method": "tools/call",
+            "params": {
+                "name": tool_name,
+                "arguments": arguments
+            }
+        }
+
+    def _parse_tools(
+        self, server_name: str, response: Optional[Dict[str, Any]]
+    ) -> Optional[List[ToolDefinition]]:
+        """Parse a tools/list response and cache the tool definitions.
+
+        Args:
+            server_name: Name of the MCP server that sent the response
+            response: JSON-RPC response, or None if the server did not answer
+
+        Returns:
+            Tool definitions, or None if the response carries no result
+        """
+        if not response or "result" not in response:
+            return None
+
+        tools = list(self._iter_tools(server_name, response["result"].get("tools", [])))
+        self._tools_cache[server_name] = tools
+        return tools
+
+    def _find_tool(
+        self, server_name: str, response: Optional[Dict[str, Any]], tool_name: str
+    ) -> Optional[ToolDefinition]:
+        """Build the definition of one tool from a tools/list response.
+
+        Only the matching entry is turned into a ToolDefinition; the scan
+        stops at the first match.
+        """
+        if not response or "result" not in response:
+            return None
+
+        matches = (
+            tool_data
+            for tool_data in response["result"].get("tools", [])
+            if tool_data.get("name") == tool_name
+        )
+        return next(self._iter_tools(server_name, matches), None)
+
+    def _iter_tools(
+        self, server_name: str, tools_data: Iterable[Dict[str, Any]]
+    ) -> Iterator[ToolDefinition]:
+        """Build tool definitions from tools/list entries as they are consumed."""
+        type_map = _JSON_TYPE_MAP
+        for tool_data in tools_data:
+            parameters = []
+            input_schema = tool_data.get("inputSchema", {})
+
+            for param_name, param_info in input_schema.get("properties", {}).items():
+                parameters.append(ToolParameter(
+                    name=param_name,
+                    type=type_map.get(param_info.get("type", "string"), ParameterType.STRING),
+                    description=param_info.get("description", ""),
+                    required=param_name in input_schema.get("required", [])
+                ))
+
+            yield ToolDefinition(
+                name=tool_data["name"],
+                description=tool_data.get("description", ""),
+                parameters=parameters,
+                category="mcp",
+                mcp_server=server_name
+            )
+
+    def _parse_call_result(self, response: Optional[Dict[str, Any]]) -> Any:
+        """Turn a tools/call response into the tool result or an error dict."""
+        if not response:
+            return {"error": "No response from MCP server"}
+
+        if "result" in response:
+            return response["result"]
+        elif "error" in response:
+            return {"error": response["error"]}
+        else:
+            return {"error": "Invalid response from MCP server"}
+
+
+class _StdioConnection:
+    """JSON-RPC over the stdio pipes of one MCP server process.
+
+    A reader thread matches responses to requests by id, so any number of
+    requests can be in flight at once. Messages that carry a "method"
+    (notifications and server-initiated requests) are passed to on_message.
+    """
+
+    def __init__(
+        self,
+        process: subprocess.Popen,
+        on_message: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        self.process = process
+        self._on_message = on_message
+        self._write = process.stdin.write
+        self._flush = process.stdin.flush
+        self._write_lock = threading.Lock()
+        self._pending: Dict[Any, Future] = {}
+        self._pending_lock = threading.Lock()
+        self._closed = False
+
+        self._reader = threading.Thread(target=self._read_messages, daemon=True)
+        self._reader.start()
+
+    def request(
+        self, messages: List[Dict[str, Any]], timeout: Optional[float] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Send requests in one write and wait for all of their responses.
+
+        Args:
+            messages: JSON-RPC requests, each with a unique "id"
+            timeout: Seconds to wait for each response (None waits forever)
+
+        Returns:
+            Responses in request order; None where the server closed the
+            connection without answering
+        """
+        futures: List[Future] = []
+        with self._pending_lock:
+            for message in messages:
+                future: Future = Future()
+                if self._closed:
+                    future.set_result(None)
+                else:
+                    self._pending[message["id"]] = future
+                futures.append(future)
+
+        try:
+            with self._write_lock:
+                self._write(b"".join(_dumps(message) + b"\n" for message in messages))
+                self._flush()
+
+            return [future.result(timeout=timeout) for future in futures]
+        except FutureTimeoutError:
+            raise TimeoutError(f"no response within {timeout}s") from None
+        finally:
+            with self._pending_lock:
+                for message in messages:
+                    self._pending.pop(message["id"], None)
+
+    def call(
+        self, message: Dict[str, Any], timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Send one request and wait for its response; see request()."""
+        request_id = message["id"]
+        future: Future = Future()
+        with self._pending_lock:
+            if self._closed:
+                return None
+            self._pending[request_id] = future
+
+        try:
+            payload = _dumps(message) + b"\n"
+            with self._write_lock:
+                self._write(payload)
+                self._flush()
+
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise TimeoutError(f"no response within {timeout}s") from None
+        finally:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the server has closed its stdout."""
+        return self._closed
+
+    def _read_messages(self) -> None:
+        """Dispatch every message the server writes until its stdout closes."""
+        try:
+            for line in iter(self.process.stdout.readline, b""):
+                try:
+                    message = _loads(line)
+                except ValueError:
+                    # Not JSON-RPC (e.g. stray output from the server)
+                    continue
+                if not isinstance(message, dict):
+                    continue
+
+                if "method" in message:
+                    if self._on_message is not None:
+                        try:
+                            self._on_message(message)
+                        except Exception:
+                            pass
+                    continue
+
+                with self._pending_lock:
+                    future = self._pending.pop(message.get("id"), None)
+                if future is not None:
+                    future.set_result(message)
+        except (OSError, ValueError):
+            # Pipe closed while reading
+            pass
+        finally:
+            with self._pending_lock:
+                self._closed = True
+                pending, self._pending = self._pending, {}
+            for future in pending.values():
+                future.set_result(None)
+
+
+class MCPClient(_MCPClientBase):
+    """Client for interacting with MCP servers via stdio."""
+
+    def __init__(
+        self,
+        weave_config: Optional[Any] = None,
+        warm: bool = False,
+        on_notification: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        request_timeout: Optional[float] = None,
+    ):
+        """Initialize MCP client.
+
+        Args:
+            weave_config: Weave configuration containing MCP server definitions
+            warm: Start all enabled servers up front (see warm_start)
+            on_notification: Called with (server_name, message) for messages a
+                server sends on its own, such as notifications
+            request_timeout: Seconds to wait for each response (None waits forever)
+        """
+        self.processes: Dict[str, subprocess.Popen] = {}
+        self._connections: Dict[str, _StdioConnection] = {}
+        # Keeps concurrent callers from starting the same server twice
+        self._start_locks: Dict[str, threading.Lock] = {}
+        self.on_notification = on_notification
+        self.request_timeout = request_timeout
+        super().__init__(weave_config)
+
+        # Stops servers at exit without keeping the client alive until then;
+        # registered while any server may be running
+        self._atexit: Optional[Callable[[], None]] = None
+        self._atexit_lock = threading.Lock()
+
+        if warm:
+            self.warm_start()
+
+    def __enter__(self) -> "MCPClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop all running servers.
+
+        Servers can still be started afterwards; they are stopped at exit.
+        """
+        with self._atexit_lock:
+            if self._atexit is not None:
+                atexit.unregister(self._atexit)
+                self._atexit = None
+        self.stop_all()
+
+    def start_server(self, server_name: str, prefetch_tools: bool = False) -> bool:
         """Start an MCP server process.
 
         Args:
             server_name: Name of the server to start
+            prefetch_tools: Also request the tool list, pipelined with the
+                initialize request, and cache it for get_server_tools
 
         Returns:
             True if server started successfully
@@ -88,69 +508,125 @@ class MCPClient:
         if server_name not in self.servers:
             raise ValueError(f"Unknown MCP server: {server_name}")
 
-        if server_name in self.processes:
-            # Already running
-            return True
+        with self._start_locks.setdefault(server_name, threading.Lock()):
+            return self._start_server(server_name, prefetch_tools)
+
+    def _start_server(self, server_name: str, prefetch_tools: bool) -> bool:
+        """Start an MCP server process; the caller holds its start lock."""
+        process = self.processes.get(server_name)
+        if process is not None:
+            connection = self._connections.get(server_name)
+            if process.poll() is None and connection is not None and not connection.closed:
+                # Already running
+                return True
+            # Server exited or closed its stdout; make sure the old process is
+            # gone before starting a fresh one
+            self._stop_servers([server_name])
 
         server = self.servers[server_name]
         if not server.enabled:
             return False
 
+        with self._atexit_lock:
+            if self._atexit is None:
+                self._atexit = close_at_exit(self.close)
+
         try:
             # Start server process with stdio communication
-            env = os.environ.copy()
-            env.update(server.env)
-
             process = subprocess.Popen(
                 [server.command] + server.args,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                env=env,
-                text=True,
-                bufsize=1
+                env=self._server_env(server),
+                bufsize=_PIPE_BUFFER_SIZE,
             )
 
             self.processes[server_name] = process
+            connection = self._connections[server_name] = _StdioConnection(
+                process, self._notification_handler(server_name)
+            )
 
             # Send initialize request
-            init_request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "clientInfo": {
-                        "name": "weave",
-                        "version": "0.1.0"
-                    }
-                }
-            }
+            requests = [self._initialize_request()]
+            if prefetch_tools:
+                requests.append(self._tools_list_request())
+            responses = connection.request(requests, timeout=self.request_timeout)
 
-            process.stdin.write(json.dumps(init_request) + "\n")
-            process.stdin.flush()
+            response = responses[0]
+            if not response or "result" not in response:
+                return False
 
-            # Read response
-            response_line = process.stdout.readline()
-            if response_line:
-                response = json.loads(response_line)
-                if "result" in response:
-                    return True
+            if prefetch_tools:
+                try:
+                    self._parse_tools(server_name, responses[1])
+                except Exception:
+                    # get_server_tools will ask again
+                    pass
 
-            return False
+            return True
 
         except Exception as e:
-            if server_name in self.processes:
-                del self.processes[server_name]
+            # Don't leave a half-started process behind (e.g. after a timeout)
+            self._stop_servers([server_name])
             raise Exception(f"Failed to start MCP server {server_name}: {e}")
 
-    def stop_server(self, server_name: str):
+    def warm_start(self, names: Optional[List[str]] = None) -> Dict[str, bool]:
+        """Start MCP servers ahead of their first use, concurrently.
+
+        Args:
+            names: Servers to start (default: all enabled servers)
+
+        Returns:
+            Mapping of server name to whether it started successfully
+        """
+        if names is None:
+            names = [name for name, server in self.servers.items() if server.enabled]
+        if not names:
+            return {}
+
+        def start(name: str) -> bool:
+            try:
+                return self.start_server(name)
+            except Exception:
+                return False
+
+        with ThreadPoolExecutor(max_workers=len(names)) as pool:
+            return dict(zip(names, pool.map(start, names)))
+
+    def stop_server(self, server_name: str) -> None:
         """Stop an MCP server process."""
-        if server_name in self.processes:
-            process = self.processes[server_name]
-            process.terminate()
-            process.wait(timeout=5)
-            del self.processes[server_name]
+        self._stop_servers([server_name])
+
+    def stop_all(self) -> None:
+        """Stop all running servers, in parallel."""
+        self._stop_servers(list(self.processes))
+
+    def _stop_servers(self, server_names: List[str]) -> None:
+        """Terminate server processes and wait for them against one deadline.
+
+        Servers still running when the deadline passes are killed, so this
+        takes at most about _STOP_TIMEOUT seconds however many servers stop.
+        """
+        processes = []
+        for server_name in server_names:
+            process = self.processes.pop(server_name, None)
+            self._connections.pop(server_name, None)
+            self._tools_cache.pop(server_name, None)
+            if process is not None:
+                processes.append(process)
+
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+
+        deadline = time.monotonic() + _STOP_TIMEOUT
+        for process in processes:
+            try:
+                process.wait(timeout=max(deadline - time.monotonic(), 0))
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
 
     def get_server_tools(self, server_name: str) -> List[ToolDefinition]:
         """Get available tools from an MCP server.
@@ -168,66 +644,75 @@ class MCPClient:
         if not server.enabled:
             return []
 
-        # Start server if not running
-        if server_name not in self.processes:
-            if not self.start_server(server_name):
-                return []
+        # Start server if not running (or restart it if it exited); a cold
+        # start fetches the tool list in the same round-trip
+        if not self.start_server(server_name, prefetch_tools=True):
+            return []
 
-        try:
-            process = self.processes[server_name]
+        # The tool list is fixed for the lifetime of a server process
+        cached = self._tools_cache.get(server_name)
+        if cached is not None:
+            return list(cached)
 
+        try:
             # Send tools/list request
-            tools_request = {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "method": "tools/list",
-                "params": {}
-            }
-
-            process.stdin.write(json.dumps(tools_request) + "\n")
-            process.stdin.flush()
-
-            # Read response
-            response_line = process.stdout.readline()
-            if not response_line:
-                return []
-
-            response = json.loads(response_line)
-            if "result" not in response:
-                return []
-
-            # Parse tools from response
-            tools = []
-            for tool_data in response["result"].get("tools", []):
-                parameters = []
-                input_schema = tool_data.get("inputSchema", {})
-
-                for param_name, param_info in input_schema.get("properties", {}).items():
-                    param_type = self._parse_param_type(param_info.get("type", "string"))
-                    parameters.append(ToolParameter(
-                        name=param_name,
-                        type=param_type,
-                        description=param_info.get("description", ""),
-                        required=param_name in input_schema.get("required", [])
-                    ))
-
-                tools.append(ToolDefinition(
-                    name=tool_data["name"],
-                    description=tool_data.get("description", ""),
-                    parameters=parameters,
-                    category="mcp",
-                    mcp_server=server_name
-                ))
+            (response,) = self._connections[server_name].request(
+                [self._tools_list_request()], timeout=self.request_timeout
+            )
 
-            return tools
+            tools = self._parse_tools(server_name, response)
+            return list(tools) if tools is not None else []
 
         except Exception as e:
-            print(f"Error getting tools from {server_name}: {e}")
+            logger.warning("Error getting tools from %s: %s", server_name, e)
             return []
 
+    def get_server_tool(self, server_name: str, tool_name: str) -> Optional[ToolDefinition]:
+        """Get the definition of a single tool from an MCP server.
+
+        Cheaper than get_server_tools when the tool list is not cached yet:
+        only the requested tool is built.
+
+        Args:
+            server_name: Name of the MCP server
+            tool_name: Name of the tool
+
+        Returns:
+            The tool definition, or None if the server has no such tool
+        """
+        if server_name not in self.servers:
+            return None
+
+        server = self.servers[server_name]
+        if not server.enabled:
+            return None
+
+        # Start server if not running (or restart it if it exited)
+        if not self.start_server(server_name):
+            return None
+
+        cached = self._tools_cache.get(server_name)
+        if cached is not None:
+            return next((tool for tool in cached if tool.name == tool_name), None)
+
+        try:
+            # Send tools/list request
+            (response,) = self._connections[server_name].request(
+                [self._tools_list_request()], timeout=self.request_timeout
+            )
+
+            return self._find_tool(server_name, response, tool_name)
+
+        except Exception as e:
+            logger.warning("Error getting tools from %s: %s", server_name, e)
+            return None
+
     def call_tool(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Call a tool on an MCP server.
 
+        Calls may be made from several threads at once, including to the
+        same server; each call waits only for its own response.
+
         Args:
             server_name: Name of the MCP server
             tool_name: Name of the tool to call
@@ -236,60 +721,329 @@ class MCPClient:
         Returns:
             Tool execution result
         """
-        if server_name not in self.processes:
+        connection = self._connections.get(server_name)
+        if connection is None or connection.closed:
+            # Start server if not running (or restart it if it exited)
             if not self.start_server(server_name):
                 return {"error": f"Failed to start MCP server: {server_name}"}
+            connection = self._connections[server_name]
 
         try:
-            process = self.processes[server_name]
-
             # Send tools/call request
-            call_request = {
-                "jsonrpc": "2.0",
-                "id": 3,
-                "method": "tools/call",
-                "params": {
-                    "name": tool_name,
-                    "arguments": arguments
-                }
-            }
+            response = connection.call(
+                self._call_request(tool_name, arguments), self.request_timeout
+            )
+
+            return self._parse_call_result(response)
+
+        except Exception as e:
+            return {"error": f"Error calling tool {tool_name}: {e}"}
 
-            process.stdin.write(json.dumps(call_request) + "\n")
-            process.stdin.flush()
+    def _notification_handler(
+        self, server_name: str
+    ) -> Optional[Callable[[Dict[str, Any]], None]]:
+        """Bind on_notification to one server, if a callback is set."""
+        if self.on_notification is None:
+            return None
+        callback = self.on_notification
+        return lambda message: callback(server_name, message)
 
-            # Read response
-            response_line = process.stdout.readline()
-            if not response_line:
-                return {"error": "No response from MCP server"}
+    def __del__(self) -> None:
+        """Clean up: stop all running servers."""
+        try:
+            self.close()
+        except Exception:
+            # Module globals may already be gone at interpreter shutdown
+            pass
 
-            response = json.loads(response_line)
 
-            if "result" in response:
-                return response["result"]
-            elif "error" in response:
-                return {"error": response["error"]}
-            else:
-                return {"error": "Invalid response from MCP server"}
+class AsyncMCPClient(_MCPClientBase):
+    """Asyncio client for MCP servers via stdio.
+
+    Same operations as MCPClient, as coroutines, so requests to different
+    servers can run concurrently. Requests to one server are serialized.
+    """
+
+    def __init__(self, weave_config: Optional[Any] = None):
+        """Initialize async MCP client.
+
+        Args:
+            weave_config: Weave configuration containing MCP server definitions
+        """
+        self.processes: Dict[str, asyncio.subprocess.Process] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        super().__init__(weave_config)
+
+    async def __aenter__(self) -> "AsyncMCPClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def _lock(self, server_name: str) -> asyncio.Lock:
+        """Get the lock that serializes traffic with one server."""
+        lock = self._locks.get(server_name)
+        if lock is None:
+            lock = self._locks[server_name] = asyncio.Lock()
+        return lock
+
+    async def start_server(self, server_name: str, prefetch_tools: bool = False) -> bool:
+        """Start an MCP server process.
+
+        Args:
+            server_name: Name of the server to start
+            prefetch_tools: Also request the tool list, pipelined with the
+                initialize request, and cache it for get_server_tools
+
+        Returns:
+            True if server started successfully
+        """
+        if server_name not in self.servers:
+            raise ValueError(f"Unknown MCP server: {server_name}")
+
+        async with self._lock(server_name):
+            process = self.processes.get(server_name)
+            if process is not None:
+                # returncode is only set once the child has been reaped, which
+                # can lag behind the server closing its stdout
+                if process.returncode is None and not process.stdout.at_eof():
+                    # Already running
+                    return True
+                # Server exited or closed its stdout; make sure the old process
+                # is gone before starting a fresh one
+                await self.stop_server(server_name)
+
+            server = self.servers[server_name]
+            if not server.enabled:
+                return False
+
+            try:
+                # Start server process with stdio communication
+                process = await asyncio.create_subprocess_exec(
+                    server.command,
+                    *server.args,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=self._server_env(server),
+                    limit=_MAX_MESSAGE_SIZE,
+                )
+
+                self.processes[server_name] = process
+
+                # Send initialize request
+                requests = [self._initialize_request()]
+                if prefetch_tools:
+                    requests.append(self._tools_list_request())
+                await self._write_messages(process, *requests)
+
+                # Read response
+                response = await self._read_response(process, requests[0]["id"])
+                if not response:
+                    return False
+
+                if prefetch_tools:
+                    # Read the tools/list reply even if initialize failed, so the
+                    # next request does not pick it up as its own response
+                    tools_response = await self._read_response(process, requests[1]["id"])
+                    if "result" in response:
+                        try:
+                            self._parse_tools(server_name, tools_response)
+                        except Exception:
+                            # get_server_tools will ask again
+                            pass
+
+                return "result" in response
+
+            except Exception as e:
+                # Don't leave a half-started process behind
+                await self.stop_server(server_name)
+                raise Exception(f"Failed to start MCP server {server_name}: {e}")
+
+    async def stop_server(self, server_name: str) -> None:
+        """Stop an MCP server process."""
+        process = self.processes.pop(server_name, None)
+        self._tools_cache.pop(server_name, None)
+        if process is not None and process.returncode is None:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=_STOP_TIMEOUT)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+
+    async def close(self) -> None:
+        """Stop all running servers."""
+        await asyncio.gather(
+            *(self.stop_server(name) for name in list(self.processes)),
+            return_exceptions=True,
+        )
+
+    async def get_server_tools(self, server_name: str) -> List[ToolDefinition]:
+        """Get available tools from an MCP server.
+
+        Args:
+            server_name: Name of the MCP server
+
+        Returns:
+            List of tool definitions from the server
+        """
+        if server_name not in self.servers:
+            return []
+
+        server = self.servers[server_name]
+        if not server.enabled:
+            return []
+
+        # Start server if not running (or restart it if it exited); a cold
+        # start fetches the tool list in the same round-trip
+        if not await self.start_server(server_name, prefetch_tools=True):
+            return []
+
+        # The tool list is fixed for the lifetime of a server process
+        cached = self._tools_cache.get(server_name)
+        if cached is not None:
+            return list(cached)
+
+        try:
+            async with self._lock(server_name):
+                process = self.processes[server_name]
+
+                # Send tools/list request
+                request = self._tools_list_request()
+                await self._write_messages(process, request)
+
+                # Read response
+                tools = self._parse_tools(
+                    server_name, await self._read_response(process, request["id"])
+                )
+            return list(tools) if tools is not None else []
 
         except Exception as e:
-            return {"error": f"Error calling tool {tool_name}: {e}"}
+            logger.warning("Error getting tools from %s: %s", server_name, e)
+            return []
+
+    async def get_server_tool(
+        self, server_name: str, tool_name: str
+    ) -> Optional[ToolDefinition]:
+        """Get the definition of a single tool from an MCP server.
+
+        Cheaper than get_server_tools when the tool list is not cached yet:
+        only the requested tool is built.
+
+        Args:
+            server_name: Name of the MCP server
+            tool_name: Name of the tool
+
+        Returns:
+            The tool definition, or None if the server has no such tool
+        """
+        if server_name not in self.servers:
+            return None
+
+        server = self.servers[server_name]
+        if not server.enabled:
+            return None
+
+        # Start server if not running (or restart it if it exited)
+        if not await self.start_server(server_name):
+            return None
+
+        cached = self._tools_cache.get(server_name)
+        if cached is not None:
+            return next((tool for tool in cached if tool.name == tool_name), None)
+
+        try:
+            async with self._lock(server_name):
+                process = self.processes[server_name]
+
+                # Send tools/list request
+                request = self._tools_list_request()
+                await self._write_messages(process, request)
+
+                # Read response
+                response = await self._read_response(process, request["id"])
+            return self._find_tool(server_name, response, tool_name)
+
+        except Exception as e:
+            logger.warning("Error getting tools from %s: %s", server_name, e)
+            return None
 
-    def _parse_param_type(self, json_type: str) -> ParameterType:
-        """Convert JSON schema type to ParameterType."""
-        type_map = {
-            "string": ParameterType.STRING,
-            "number": ParameterType.NUMBER,
-            "integer": ParameterType.NUMBER,
-            "boolean": ParameterType.BOOLEAN,
-            "array": ParameterType.ARRAY,
-            "object": ParameterType.OBJECT,
+    async def get_all_server_tools(self) -> Dict[str, List[ToolDefinition]]:
+        """Get the tools of every enabled server, querying them concurrently.
+
+        Returns:
+            Mapping of server name to its tool definitions
+        """
+        names = [name for name, server in self.servers.items() if server.enabled]
+        results = await asyncio.gather(
+            *(self.get_server_tools(name) for name in names), return_exceptions=True
+        )
+        return {
+            name: [] if isinstance(tools, BaseException) else tools
+            for name, tools in zip(names, results)
         }
-        return type_map.get(json_type, ParameterType.STRING)
 
-    def __del__(self):
-        """Clean up: stop all running servers."""
-        for server_name in list(self.processes.keys()):
+    async def call_tool(
+        self, server_name: str, tool_name: str, arguments: Dict[str, Any]
+    ) -> Any:
+        """Call a tool on an MCP server.
+
+        Args:
+            server_name: Name of the MCP server
+            tool_name: Name of the tool to call
+            arguments: Tool arguments
+
+        Returns:
+            Tool execution result
+        """
+        # Start server if not running (or restart it if it exited)
+        if not await self.start_server(server_name):
+            return {"error": f"Failed to start MCP server: {server_name}"}
+
+        try:
+            async with self._lock(server_name):
+                process = self.processes[server_name]
+
+                # Send tools/call request
+                request = self._call_request(tool_name, arguments)
+                await self._write_messages(process, request)
+
+                # Read response
+                response = await self._read_response(process, request["id"])
+            return self._parse_call_result(response)
+
+        except Exception as e:
+            return {"error": f"Error calling tool {tool_name}: {e}"}
+
+    async def _write_messages(
+        self, process: asyncio.subprocess.Process, *messages: Dict[str, Any]
+    ) -> None:
+        """Send JSON-RPC messages to a server over its stdin pipe in one write."""
+        process.stdin.write(b"".join(_dumps(message) + b"\n" for message in messages))
+        await process.stdin.drain()
+
+    async def _read_response(
+        self, process: asyncio.subprocess.Process, request_id: int
+    ) -> Optional[Dict[str, Any]]:
+        """Read messages from a server until the response to request_id arrives.
+
+        Notifications and other unrelated messages are skipped.
+
+        Returns:
+            The response, or None if the server closed its stdout first
+        """
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                return None
             try:
-                self.stop_server(server_name)
-            except:
-                pass
+                message = _loads(line)
+            except ValueError:
+                continue
+            if (
+                isinstance(message, dict)
+                and message.get("id") == request_id
+                and "method" not in message
+            ):
+                return message
@@ -0,0 +1,126 @@
+"""Tests for the agent creator MCP server example."""
+
+import asyncio
+import importlib.util
+import io
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+SERVER_PATH = (
+    Path(__file__).parent.parent
+    / "examples"
+    / "agent-creator-mcp-example"
+    / "agent_creator_server.py"
+)
+
+
+@pytest.fixture
+def server_module():
+    """The example server, loaded from its file."""
+    spec = importlib.util.spec_from_file_location("agent_creator_server", SERVER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestStdin:
+    """Test reading JSON-RPC lines from stdin."""
+
+    def test_read_line_skips_overlong_line(self, server_module):
+        """An overlong line should be reported as None and reading resume after it."""
+        server = server_module.AgentCreatorMCPServer()
+
+        async def run():
+            reader = asyncio.StreamReader(limit=16)
+            reader.feed_data(b"short\n" + b"x" * 100 + b"\nnext\nlast")
+            reader.feed_eof()
+            return [await server._read_line(reader) for _ in range(5)]
+
+        assert asyncio.run(run()) == [b"short\n", None, b"next\n", b"last", b""]
+
+    def test_stdin_read_on_thread_without_pipe_support(self, server_module, monkeypatch):
+        """Without pipe support in the loop, stdin should be read on a worker thread."""
+        monkeypatch.setattr(server_module, "_STDIN_LIMIT", 64)
+        stdin = io.BytesIO(
+            b'{"jsonrpc": "2.0", "id": 1, "method": "' + b"x" * 100 + b'"}\n'
+            b'{"jsonrpc": "2.0", "id": 2, "method": "tools/list"}\n'
+        )
+        stdout = io.BytesIO()
+        monkeypatch.setattr(server_module.sys, "stdin", SimpleNamespace(buffer=stdin))
+        monkeypatch.setattr(server_module.sys, "stdout", SimpleNamespace(buffer=stdout))
+
+        async def run():
+            loop = asyncio.get_running_loop()
+
+            async def connect_read_pipe(*args):
+                raise NotImplementedError
+
+            monkeypatch.setattr(loop, "connect_read_pipe", connect_read_pipe)
+            await server_module.AgentCreatorMCPServer().run()
+
+        asyncio.run(run())
+
+        error, tools = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert error["error"]["code"] == -32700
+        assert "id" not in error
+        assert tools["id"] == 2
+        assert tools["tools"]
+
+
+class TestSessions:
+    """Test the bounded session store."""
+
+    def test_oldest_session_evicted_past_max_sessions(self, server_module, monkeypatch):
+        """Starting more than MAX_SESSIONS sessions should drop the least recently used."""
+        monkeypatch.setattr(server_module, "MAX_SESSIONS", 3)
+        server = server_module.AgentCreatorMCPServer()
+
+        for session_id in ("a", "b", "c", "d"):
+            server.start_session(session_id)
+
+        assert list(server.sessions) == ["b", "c", "d"]
+        assert server.get_session_status("a")["status"] == "error"
+
+    def test_access_marks_session_recently_used(self, server_module, monkeypatch):
+        """A session that was just used should outlive older untouched ones."""
+        monkeypatch.setattr(server_module, "MAX_SESSIONS", 3)
+        server = server_module.AgentCreatorMCPServer()
+        for session_id in ("a", "b", "c"):
+            server.start_session(session_id)
+
+        server.answer_question("a", "researcher")
+        server.start_session("d")
+
+        assert list(server.sessions) == ["c", "a", "d"]
+        assert server.sessions["a"].agent_name == "researcher"
+
+
+class TestEncodeResponse:
+    """Test serialization of JSON-RPC responses."""
+
+    def test_tools_list_envelope_is_valid_json(self, server_module):
+        """The pre-encoded tools/list payload should splice into a valid response."""
+        server = server_module.AgentCreatorMCPServer()
+        request = {"jsonrpc": "2.0", "id": "req-7", "method": "tools/list"}
+
+        response = asyncio.run(server.handle_request(request))
+        message = json.loads(server._encode_response(request, response))
+
+        assert message["id"] == "req-7"
+        assert message["jsonrpc"] == "2.0"
+        assert message["tools"] == server.list_available_tools()
+
+    def test_tools_list_without_id(self, server_module):
+        """A tools/list notification should still encode to valid JSON, without an id."""
+        server = server_module.AgentCreatorMCPServer()
+        request = {"jsonrpc": "2.0", "method": "tools/list"}
+
+        response = asyncio.run(server.handle_request(request))
+        message = json.loads(server._encode_response(request, response))
+
+        assert "id" not in message
+        assert message["jsonrpc"] == "2.0"
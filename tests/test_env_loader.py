@@ -0,0 +1,116 @@
+"""Tests for the .env file loader."""
+
+import os
+
+import pytest
+
+from weave.core import env_loader
+from weave.core.env_loader import load_env_file
+
+
+KEYS = ("WEAVE_TEST_BARE", "WEAVE_TEST_DOUBLE", "WEAVE_TEST_SINGLE", "WEAVE_TEST_QUOTE")
+
+
+@pytest.fixture(autouse=True)
+def clean_env():
+    """Run every test without the variables the .env files set, and remove them after."""
+    for key in KEYS:
+        os.environ.pop(key, None)
+    yield
+    for key in KEYS:
+        os.environ.pop(key, None)
+
+
+class TestParseEnvFile:
+    """Test parsing of .env files."""
+
+    def test_quoted_and_bare_values(self, tmp_path):
+        """Quotes around a value should be removed, bare values kept as written."""
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "WEAVE_TEST_BARE=plain value # not a comment\n"
+            'WEAVE_TEST_DOUBLE = "double quoted"\n'
+            "WEAVE_TEST_SINGLE='single quoted'\n"
+        )
+
+        load_env_file(env_file)
+
+        assert os.environ["WEAVE_TEST_BARE"] == "plain value # not a comment"
+        assert os.environ["WEAVE_TEST_DOUBLE"] == "double quoted"
+        assert os.environ["WEAVE_TEST_SINGLE"] == "single quoted"
+
+    def test_comments_and_blank_lines_are_skipped(self, tmp_path):
+        """Comments, blank lines and lines without '=' should set nothing."""
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "# WEAVE_TEST_DOUBLE=commented out\n"
+            "\n"
+            "   \n"
+            "WEAVE_TEST_SINGLE\n"
+            "WEAVE_TEST_BARE=value\n"
+        )
+
+        load_env_file(env_file)
+
+        assert os.environ["WEAVE_TEST_BARE"] == "value"
+        assert "WEAVE_TEST_DOUBLE" not in os.environ
+        assert "WEAVE_TEST_SINGLE" not in os.environ
+
+    def test_existing_variables_are_not_overridden(self, tmp_path, monkeypatch):
+        """Variables already set should keep their value; empty ones are filled in."""
+        monkeypatch.setenv("WEAVE_TEST_BARE", "from environment")
+        monkeypatch.setenv("WEAVE_TEST_DOUBLE", "")
+        env_file = tmp_path / ".env"
+        env_file.write_text("WEAVE_TEST_BARE=from file\nWEAVE_TEST_DOUBLE=from file\n")
+
+        load_env_file(env_file)
+
+        assert os.environ["WEAVE_TEST_BARE"] == "from environment"
+        assert os.environ["WEAVE_TEST_DOUBLE"] == "from file"
+
+    def test_lone_quote_value_is_kept(self, tmp_path):
+        """A value that is a single quote character should be kept as-is."""
+        env_file = tmp_path / ".env"
+        env_file.write_text('WEAVE_TEST_QUOTE="\n')
+
+        load_env_file(env_file)
+
+        assert os.environ["WEAVE_TEST_QUOTE"] == '"'
+
+
+class TestEnvFileCache:
+    """Test reuse of parsed .env files."""
+
+    def test_unchanged_file_is_not_read_again(self, tmp_path, monkeypatch):
+        """Loading an unchanged file again should reuse the parsed assignments."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("WEAVE_TEST_BARE=value\n")
+        reads = []
+        read_assignments = env_loader._read_assignments
+
+        def counting_read(path):
+            reads.append(path)
+            return read_assignments(path)
+
+        monkeypatch.setattr(env_loader, "_read_assignments", counting_read)
+
+        load_env_file(env_file)
+        del os.environ["WEAVE_TEST_BARE"]
+        load_env_file(env_file)
+
+        assert len(reads) == 1
+        assert os.environ["WEAVE_TEST_BARE"] == "value"
+
+    def test_changed_file_is_parsed_again(self, tmp_path):
+        """A file whose mtime changed should be parsed again."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("WEAVE_TEST_BARE=old\n")
+        load_env_file(env_file)
+        mtime_ns = env_file.stat().st_mtime_ns
+
+        env_file.write_text("WEAVE_TEST_BARE=new\n")
+        os.utime(env_file, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+        del os.environ["WEAVE_TEST_BARE"]
+        load_env_file(env_file)
+
+        assert os.environ["WEAVE_TEST_BARE"] == "new"
@@ -0,0 +1,356 @@
+"""Tests for the stdio MCP client."""
+
+import asyncio
+import subprocess
+import sys
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from weave.core.models import MCPServerConfig
+from weave.tools.mcp_client import AsyncMCPClient, MCPClient, MCPServer
+
+
+# Minimal MCP server: answers tools/call on a thread after the requested delay,
+# so responses can arrive out of order, and can send a notification first,
+# exit without answering, or close its stdout and keep running.
+FAKE_SERVER = textwrap.dedent(
+    """
+    import json, os, sys, threading, time
+
+    lock = threading.Lock()
+
+    def send(message):
+        with lock:
+            sys.stdout.write(json.dumps(message) + "\\n")
+            sys.stdout.flush()
+
+    def call(request):
+        args = request["params"]["arguments"]
+        if args.get("notify"):
+            send({"jsonrpc": "2.0", "method": "notifications/message", "params": {}})
+        if args.get("exit"):
+            os._exit(0)
+        if args.get("close_stdout"):
+            os.close(sys.stdout.fileno())
+            return
+        time.sleep(args.get("delay", 0))
+        send({"jsonrpc": "2.0", "id": request["id"], "result": args})
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        if request["method"] == "initialize":
+            send({"jsonrpc": "2.0", "id": request["id"], "result": {}})
+        elif request["method"] == "tools/list":
+            tools = [{"name": name, "inputSchema": {}} for name in ("echo", "other")]
+            send({"jsonrpc": "2.0", "id": request["id"], "result": {"tools": tools}})
+        elif request["method"] == "tools/call":
+            threading.Thread(target=call, args=(request,)).start()
+    """
+)
+
+
+# MCP server that answers initialize only after a delay
+SLOW_START_SERVER = textwrap.dedent(
+    """
+    import json, sys, time
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        time.sleep(2)
+        print(json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": {}}), flush=True)
+    """
+)
+
+
+@pytest.fixture
+def fake_config(tmp_path):
+    """Weave config with a single fake MCP server."""
+    script = tmp_path / "fake_mcp_server.py"
+    script.write_text(FAKE_SERVER)
+    return SimpleNamespace(
+        mcp_servers={"fake": {"command": sys.executable, "args": [str(script)]}}
+    )
+
+
+class TestMCPServer:
+    """Test MCPServer construction from config entries."""
+
+    def test_from_dict_fills_defaults(self):
+        """Missing optional fields should get their defaults."""
+        server = MCPServer.from_dict("fs", {"command": "mcp-fs", "args": None})
+
+        assert server.command == "mcp-fs"
+        assert server.args == []
+        assert server.env == {}
+        assert server.enabled is True
+
+    def test_from_dict_accepts_weave_config_model(self):
+        """MCPServerConfig entries from the weave config should be accepted."""
+        server = MCPServer.from_dict("fs", MCPServerConfig(command="mcp-fs", args=["/tmp"]))
+
+        assert server.args == ["/tmp"]
+
+    def test_from_dict_requires_command(self):
+        """An entry without a command should be rejected up front."""
+        with pytest.raises(ValueError, match="fs"):
+            MCPServer.from_dict("fs", {"args": []})
+
+    def test_from_dict_requires_mapping(self):
+        """An entry that is not a mapping (e.g. an empty YAML key) should be rejected."""
+        with pytest.raises(ValueError, match="fs"):
+            MCPServer.from_dict("fs", None)
+
+    def test_invalid_weave_config_entry_raises(self):
+        """A bad server in the weave config should fail client construction."""
+        with pytest.raises(ValueError, match="broken"):
+            MCPClient(weave_config=SimpleNamespace(mcp_servers={"broken": {"args": []}}))
+
+    def test_invalid_config_file_entries_are_skipped(self, tmp_path, monkeypatch):
+        """Bad servers in the user config file should be skipped, keeping the rest."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        config_dir = tmp_path / ".weave"
+        config_dir.mkdir()
+        (config_dir / "mcp_config.yaml").write_text(
+            "mcp_servers:\n"
+            "  good:\n"
+            "    command: mcp-good\n"
+            "  no_command:\n"
+            "    args: []\n"
+            "  empty:\n"
+        )
+
+        client = MCPClient()
+
+        assert list(client.servers) == ["good"]
+
+
+class TestMCPClient:
+    """Test request/response handling of MCPClient."""
+
+    def test_concurrent_calls_get_their_own_responses(self, fake_config):
+        """Responses arriving out of order should reach the matching caller."""
+        client = MCPClient(weave_config=fake_config)
+        try:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(
+                    lambda i: client.call_tool("fake", "echo", {"i": i, "delay": (4 - i) / 20}),
+                    range(4),
+                ))
+
+            assert [result["i"] for result in results] == [0, 1, 2, 3]
+        finally:
+            client.stop_server("fake")
+
+    def test_notifications_go_to_callback(self, fake_config):
+        """Messages without a matching request should be passed to on_notification."""
+        received = threading.Event()
+        notifications = []
+
+        def on_notification(server_name, message):
+            notifications.append((server_name, message["method"]))
+            received.set()
+
+        client = MCPClient(weave_config=fake_config, on_notification=on_notification)
+        try:
+            result = client.call_tool("fake", "echo", {"notify": True})
+
+            assert result == {"notify": True}
+            assert received.wait(timeout=5)
+            assert notifications == [("fake", "notifications/message")]
+        finally:
+            client.stop_server("fake")
+
+    def test_request_timeout(self, fake_config):
+        """A call that outlives request_timeout should return an error."""
+        client = MCPClient(weave_config=fake_config, request_timeout=0.1)
+        try:
+            result = client.call_tool("fake", "echo", {"delay": 1})
+
+            assert "error" in result
+        finally:
+            client.stop_server("fake")
+
+    def test_get_server_tool(self, fake_config):
+        """A single tool should be found by name, with or without a cached list."""
+        client = MCPClient(weave_config=fake_config)
+        try:
+            assert client.get_server_tool("fake", "other").name == "other"
+            assert client.get_server_tool("fake", "missing") is None
+
+            client.get_server_tools("fake")
+            assert client.get_server_tool("fake", "echo").name == "echo"
+        finally:
+            client.stop_server("fake")
+
+    def test_restart_after_server_closes_stdout(self, fake_config):
+        """A server that closed its stdout should be stopped before a new one starts."""
+        client = MCPClient(weave_config=fake_config)
+        try:
+            failed = client.call_tool("fake", "echo", {"close_stdout": True})
+            first = client.processes["fake"]
+
+            assert "error" in failed
+            assert client.call_tool("fake", "echo", {"i": 1}) == {"i": 1}
+            assert client.processes["fake"] is not first
+            assert first.poll() is not None
+        finally:
+            client.stop_server("fake")
+
+    def test_context_manager_stops_servers(self, fake_config):
+        """Leaving the with block should stop every server the client started."""
+        with MCPClient(weave_config=fake_config) as client:
+            client.start_server("fake")
+            process = client.processes["fake"]
+
+        assert client.processes == {}
+        assert process.poll() is not None
+
+    def test_warm_client_starts_enabled_servers(self, fake_config):
+        """warm=True should start every enabled server before the first call."""
+        servers = dict(fake_config.mcp_servers)
+        servers["off"] = {"command": "unused", "enabled": False}
+
+        with MCPClient(weave_config=SimpleNamespace(mcp_servers=servers), warm=True) as client:
+            assert list(client.processes) == ["fake"]
+            assert client.processes["fake"].poll() is None
+
+    def test_warm_start_reports_failures(self, fake_config, tmp_path):
+        """warm_start should report servers that fail to start instead of raising."""
+        servers = dict(fake_config.mcp_servers)
+        servers["fake2"] = servers["fake"]
+        servers["missing"] = {"command": str(tmp_path / "no-such-server")}
+
+        with MCPClient(weave_config=SimpleNamespace(mcp_servers=servers)) as client:
+            started = client.warm_start()
+
+            assert started == {"fake": True, "fake2": True, "missing": False}
+            assert set(client.processes) == {"fake", "fake2"}
+
+    def test_restart_after_server_exits(self, fake_config):
+        """The next call after the server exited should start a new one."""
+        with MCPClient(weave_config=fake_config) as client:
+            failed = client.call_tool("fake", "echo", {"exit": True})
+            first = client.processes["fake"]
+
+            assert "error" in failed
+            assert client.call_tool("fake", "echo", {"i": 1}) == {"i": 1}
+            assert client.processes["fake"] is not first
+
+    def test_server_started_after_close_is_stopped_at_exit(self, fake_config):
+        """Servers started after close() should still be stopped at exit."""
+        client = MCPClient(weave_config=fake_config)
+        client.start_server("fake")
+        client.close()
+        assert client._atexit is None
+
+        client.start_server("fake")
+        process = client.processes["fake"]
+        assert client._atexit is not None
+
+        client._atexit()
+        assert client.processes == {}
+        assert process.poll() is not None
+
+    def test_start_timeout_stops_process(self, tmp_path, monkeypatch):
+        """A server that times out during initialize should not be left running."""
+        script = tmp_path / "slow_mcp_server.py"
+        script.write_text(SLOW_START_SERVER)
+        config = SimpleNamespace(
+            mcp_servers={"slow": {"command": sys.executable, "args": [str(script)]}}
+        )
+
+        started = []
+        real_popen = subprocess.Popen
+
+        def popen(*args, **kwargs):
+            process = real_popen(*args, **kwargs)
+            started.append(process)
+            return process
+
+        monkeypatch.setattr(subprocess, "Popen", popen)
+
+        client = MCPClient(weave_config=config, request_timeout=0.3)
+        with pytest.raises(Exception, match="slow"):
+            client.start_server("slow")
+
+        assert client.processes == {}
+        assert started[0].poll() is not None
+
+
+class TestAsyncMCPClient:
+    """Test AsyncMCPClient against the same fake server."""
+
+    def test_get_all_server_tools(self, fake_config):
+        """Tools of every enabled server should be listed."""
+        servers = dict(fake_config.mcp_servers)
+        servers["fake2"] = servers["fake"]
+        servers["off"] = {"command": "unused", "enabled": False}
+
+        async def run():
+            async with AsyncMCPClient(SimpleNamespace(mcp_servers=servers)) as client:
+                return await client.get_all_server_tools()
+
+        tools = asyncio.run(run())
+
+        assert set(tools) == {"fake", "fake2"}
+        assert [tool.name for tool in tools["fake2"]] == ["echo", "other"]
+
+    def test_call_tool_skips_notifications(self, fake_config):
+        """A notification sent before the response should not be taken as the result."""
+
+        async def run():
+            async with AsyncMCPClient(fake_config) as client:
+                return await client.call_tool("fake", "echo", {"notify": True})
+
+        assert asyncio.run(run()) == {"notify": True}
+
+    def test_restart_after_server_exits(self, fake_config):
+        """The next call after the server exited should start a new one."""
+
+        async def run():
+            async with AsyncMCPClient(fake_config) as client:
+                failed = await client.call_tool("fake", "echo", {"exit": True})
+                first = client.processes["fake"]
+                result = await client.call_tool("fake", "echo", {"i": 1})
+                return failed, result, first is not client.processes["fake"]
+
+        failed, result, restarted = asyncio.run(run())
+
+        assert failed == {"error": "No response from MCP server"}
+        assert result == {"i": 1}
+        assert restarted
+
+    def test_restart_after_server_closes_stdout(self, fake_config):
+        """A server that closed its stdout should be stopped before a new one starts."""
+
+        async def run():
+            async with AsyncMCPClient(fake_config) as client:
+                failed = await client.call_tool("fake", "echo", {"close_stdout": True})
+                first = client.processes["fake"]
+                result = await client.call_tool("fake", "echo", {"i": 1})
+                return failed, result, first
+
+        failed, result, first = asyncio.run(run())
+
+        assert failed == {"error": "No response from MCP server"}
+        assert result == {"i": 1}
+        assert first.returncode is not None
+
+    def test_close_stops_servers(self, fake_config):
+        """close() should stop every running server."""
+
+        async def run():
+            client = AsyncMCPClient(fake_config)
+            await client.start_server("fake")
+            process = client.processes["fake"]
+            await client.close()
+            return client, process
+
+        client, process = asyncio.run(run())
+
+        assert client.processes == {}
+        assert process.returncode is not None
@@ -81,6 +81,21 @@ class TestShortTermMemory:
         assert filtered[0].role == "system"
         assert filtered[0].content == "System prompt"
 
+    def test_buffer_strategy_when_system_messages_fill_buffer(self):
+        """Buffer strategy should drop other messages when system messages use the budget."""
+        stm = ShortTermMemory(strategy="buffer", max_messages=2)
+
+        messages = [
+            ConversationMessage(role="system", content="System prompt"),
+            ConversationMessage(role="system", content="Summary"),
+        ]
+        for i in range(5):
+            messages.append(ConversationMessage(role="user", content=f"Message {i}"))
+
+        filtered = stm.apply_strategy(messages, auto_compact=False)
+
+        assert [msg.content for msg in filtered] == ["System prompt", "Summary"]
+
     def test_sliding_window_strategy(self):
         """Sliding window should keep only last N messages."""
         stm = ShortTermMemory(strategy="sliding_window", max_messages=3)
@@ -153,6 +168,74 @@ class TestLongTermMemory:
         assert "First memory" in loaded
         assert "Second memory" in loaded
 
+    def test_memory_file_header_written_once(self, tmp_path):
+        """The file header should only be written when the file is created."""
+        ltm = LongTermMemory(memory_dir=tmp_path)
+
+        ltm.save_memory("test_agent", Memory(content="First memory"))
+        ltm.save_memory("test_agent", Memory(content="Second memory"))
+
+        memory_file = tmp_path / "test_agent_memory.md"
+        content = memory_file.read_text()
+
+        assert content.startswith("# Long-Term Memory: test_agent\n\n")
+        assert content.count("# Long-Term Memory") == 1
+        assert content.count("\n\n---\n\n") == 1
+        assert memory_file.stat().st_mode & 0o777 == 0o600
+
+    def test_existing_memory_file_is_secured(self, tmp_path):
+        """Saving to a pre-existing world-readable file should restrict it."""
+        ltm = LongTermMemory(memory_dir=tmp_path)
+
+        memory_file = tmp_path / "test_agent_memory.md"
+        memory_file.write_text("# Long-Term Memory: test_agent\n\n")
+        memory_file.chmod(0o644)
+
+        ltm.save_memory("test_agent", Memory(content="Test memory"))
+
+        assert memory_file.stat().st_mode & 0o777 == 0o600
+
+    def test_load_memories_sees_new_content(self, tmp_path):
+        """Loaded memories should reflect saves and external edits."""
+        ltm = LongTermMemory(memory_dir=tmp_path)
+
+        ltm.save_memory("test_agent", Memory(content="First memory"))
+        assert "First memory" in ltm.load_memories("test_agent")
+
+        ltm.save_memory("test_agent", Memory(content="Second memory"))
+        assert "Second memory" in ltm.load_memories("test_agent")
+
+        memory_file = tmp_path / "test_agent_memory.md"
+        memory_file.write_text("# Edited by hand\n")
+        assert ltm.load_memories("test_agent") == "# Edited by hand\n"
+
+    def test_saved_memory_visible_to_other_instances(self, tmp_path):
+        """A saved memory should be on disk without closing the instance that saved it."""
+        writer = LongTermMemory(memory_dir=tmp_path)
+        reader = LongTermMemory(memory_dir=tmp_path)
+
+        writer.save_memory("test_agent", Memory(content="Shared memory"))
+
+        assert "Shared memory" in reader.load_memories("test_agent")
+
+    def test_save_after_close_reopens_file(self, tmp_path):
+        """Saving after close should reopen the file and close it again at exit."""
+        ltm = LongTermMemory(memory_dir=tmp_path)
+        memory_file = tmp_path / "test_agent_memory.md"
+
+        ltm.save_memory("test_agent", Memory(content="First memory"))
+        ltm.close()
+        assert ltm._atexit is None
+
+        ltm.save_memory("test_agent", Memory(content="Second memory"))
+        assert ltm._atexit is not None
+
+        ltm._atexit()
+        assert ltm._handles == {}
+        content = memory_file.read_text()
+        assert content.count("# Long-Term Memory") == 1
+        assert "Second memory" in content
+
     def test_clear_memories(self, tmp_path):
         """Clearing memories should delete the memory file."""
         ltm = LongTermMemory(memory_dir=tmp_path)
@@ -237,6 +320,79 @@ class TestMemoryManager:
         assert len(filtered) == 3
         assert filtered[0].content == "Message 2"
 
+    def test_apply_buffer_strategy_to_growing_session(self):
+        """Buffer strategy should track system messages as the session grows."""
+        manager = MemoryManager(
+            agent_name="test_agent",
+            strategy="buffer",
+            max_messages=4,
+            persist=False,
+        )
+
+        session = ConversationSession(session_id="test")
+        session.add_message("system", "System prompt")
+        for i in range(5):
+            session.add_message("user", f"Message {i}")
+
+        filtered = manager.apply_short_term_strategy(session)
+        assert [msg.content for msg in filtered] == [
+            "System prompt", "Message 2", "Message 3", "Message 4"
+        ]
+
+        session.add_message("system", "Late instruction")
+        session.add_message("user", "Message 5")
+
+        filtered = manager.apply_short_term_strategy(session)
+        assert [msg.content for msg in filtered] == [
+            "System prompt", "Late instruction", "Message 4", "Message 5"
+        ]
+
+    def test_apply_buffer_strategy_after_messages_cleared(self):
+        """Buffer strategy should not keep system messages removed in place."""
+        manager = MemoryManager(
+            agent_name="test_agent",
+            strategy="buffer",
+            max_messages=3,
+            persist=False,
+        )
+
+        session = ConversationSession(session_id="test")
+        session.add_message("system", "OLD PROMPT")
+        for i in range(5):
+            session.add_message("user", f"Message {i}")
+        manager.apply_short_term_strategy(session)
+
+        session.messages.clear()
+        session.add_message("system", "NEW PROMPT")
+        for i in range(5):
+            session.add_message("user", f"v{i}")
+
+        filtered = manager.apply_short_term_strategy(session)
+        assert [msg.content for msg in filtered] == ["NEW PROMPT", "v3", "v4"]
+
+    def test_apply_buffer_strategy_after_message_replaced(self):
+        """Buffer strategy should see a message replaced in place by a system message."""
+        manager = MemoryManager(
+            agent_name="test_agent",
+            strategy="buffer",
+            max_messages=3,
+            persist=False,
+        )
+
+        session = ConversationSession(session_id="test")
+        for i in range(5):
+            session.add_message("user", f"Message {i}")
+        manager.apply_short_term_strategy(session)
+
+        session.messages[0] = ConversationMessage(
+            role="system", content="System prompt", timestamp=time.time()
+        )
+
+        filtered = manager.apply_short_term_strategy(session)
+        assert [msg.content for msg in filtered] == [
+            "System prompt", "Message 3", "Message 4"
+        ]
+
     def test_save_long_term_memory(self, tmp_path):
         """Memory manager should save to long-term storage."""
         manager = MemoryManager(